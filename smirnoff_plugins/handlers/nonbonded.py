@@ -175,9 +175,9 @@ class CustomNonbondedHandler(ParameterHandler, abc.ABC):
         # Check to see if the system already contains a normal non-bonded force with
         # particles which have a non-zero epsilon.
         existing_forces = [
-            system.getForce(i)
-            for i in range(system.getNumForces())
-            if isinstance(system.getForce(i), openmm.NonbondedForce)
+            force
+            for force in (system.getForce(i) for i in range(system.getNumForces()))
+            if isinstance(force, openmm.NonbondedForce)
         ]
 
         assert (
@@ -225,10 +225,23 @@ class CustomNonbondedHandler(ParameterHandler, abc.ABC):
         # Now get all matches and set the parameters
         matches = self.find_matches(topology)
 
+        # Process each matched parameter only once, and re-use it for every atom and
+        # 1-4 pair which it is applied to.
+        processed_parameters = {}
+        particle_parameters = {}
+
         for atom_key, atom_match in matches.items():
-            force.setParticleParameters(
-                atom_key[0], self._process_parameters(atom_match.parameter_type)
-            )
+
+            parameter_type = atom_match.parameter_type
+            parameter_key = id(parameter_type)
+
+            if parameter_key not in processed_parameters:
+                processed_parameters[parameter_key] = self._process_parameters(
+                    parameter_type
+                )
+
+            particle_parameters[atom_key[0]] = processed_parameters[parameter_key]
+            force.setParticleParameters(atom_key[0], particle_parameters[atom_key[0]])
 
         bonds = [
             [atom.topology_particle_index for atom in bond.atoms]
@@ -280,12 +293,8 @@ class CustomNonbondedHandler(ParameterHandler, abc.ABC):
                     atom_index1,
                     atom_index2,
                     (
-                        *self._process_parameters(
-                            matches[(atom_index1,)].parameter_type
-                        ),
-                        *self._process_parameters(
-                            matches[(atom_index2,)].parameter_type
-                        ),
+                        *particle_parameters[atom_index1],
+                        *particle_parameters[atom_index2],
                     ),
                 )
             system.addForce(scaled_force)
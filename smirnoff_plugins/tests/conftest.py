@@ -1,3 +1,4 @@
+import copy
 import math
 
 import numpy
@@ -7,9 +8,10 @@ from openff.toolkit.typing.engines.smirnoff import ForceField, ParameterList
 from simtk import unit
 
 
-@pytest.fixture()
-def buckingham_water_force_field() -> ForceField:
-    """Create a buckingham water model Forcefield object."""
+@pytest.fixture(scope="session")
+def _buckingham_water_force_field() -> ForceField:
+    """Create a buckingham water model Forcefield object. This should not be modified
+    by tests, use ``buckingham_water_force_field`` instead."""
 
     force_field = ForceField(load_plugins=True)
 
@@ -91,8 +93,11 @@ def buckingham_water_force_field() -> ForceField:
     return force_field
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def water_box_topology() -> Topology:
+    """Create a periodic box of water. This is shared between tests and so should
+    not be modified."""
+
     mol = Molecule.from_smiles("O")
     mol.generate_conformers()
 
@@ -109,10 +114,18 @@ def water_box_topology() -> Topology:
 
 
 @pytest.fixture()
-def ideal_water_force_field() -> ForceField:
+def buckingham_water_force_field(_buckingham_water_force_field) -> ForceField:
+    """Returns a copy of the buckingham water force field which may be freely
+    modified."""
+    return copy.deepcopy(_buckingham_water_force_field)
+
+
+@pytest.fixture(scope="session")
+def _ideal_water_force_field() -> ForceField:
     """Returns a force field that will assign constraints, a vdW handler and
     a library charge handler to a three site water molecule with all LJ
-    ``epsilon=0.0`` and all ``q=0.0``.
+    ``epsilon=0.0`` and all ``q=0.0``. This should not be modified by tests, use
+    ``ideal_water_force_field`` instead.
     """
     ff = ForceField(load_plugins=True)
 
@@ -149,3 +162,9 @@ def ideal_water_force_field() -> ForceField:
     )
 
     return ff
+
+
+@pytest.fixture()
+def ideal_water_force_field(_ideal_water_force_field) -> ForceField:
+    """Returns a copy of the ideal water force field which may be freely modified."""
+    return copy.deepcopy(_ideal_water_force_field)
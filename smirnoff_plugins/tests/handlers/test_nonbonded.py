@@ -1,3 +1,4 @@
+import numpy
 import pytest
 from openff.toolkit.topology import Molecule
 from openff.toolkit.typing.engines.smirnoff import ForceField
@@ -6,53 +7,37 @@ from simtk import openmm, unit
 from smirnoff_plugins.utilities.openmm import (
     evaluate_energy,
     evaluate_water_energy_at_distances,
+    find_forces,
 )
 
 
-@pytest.mark.parametrize(
-    "switch_width, use_switch",
-    [
-        pytest.param(1 * unit.angstroms, True, id="Switch on"),
-        pytest.param(0 * unit.angstroms, False, id="Switch off"),
-    ],
-)
-def test_use_switch_width(
-    water_box_topology, buckingham_water_force_field, switch_width, use_switch
-):
-    """Make sure the switch width is respected when requested"""
+def test_switch_behavior(water_box_topology, buckingham_water_force_field):
+    """Make sure the switch width is respected when set, and that the switching
+    function is turned off for a zero width."""
 
     buckingham_handler = buckingham_water_force_field.get_parameter_handler(
         "DampedBuckingham68"
     )
-    buckingham_handler.switch_width = switch_width
-    system = buckingham_water_force_field.create_openmm_system(water_box_topology)
-    for i in range(system.getNumForces()):
-        force = system.getForce(i)
-        if isinstance(force, openmm.CustomNonbondedForce):
-            custom_force = force
-            break
-    assert custom_force.getUseSwitchingFunction() is use_switch
-
+    default_cutoff = buckingham_handler.cutoff
 
-def test_switch_width(water_box_topology, buckingham_water_force_field):
-    """Make sure the switch width is respected when set."""
-
-    buckingham_handler = buckingham_water_force_field.get_parameter_handler(
-        "DampedBuckingham68"
-    )
     buckingham_handler.switch_width = 1.0 * unit.angstroms
     buckingham_handler.cutoff = 8.5 * unit.angstroms
 
     system = buckingham_water_force_field.create_openmm_system(water_box_topology)
-    for i in range(system.getNumForces()):
-        force = system.getForce(i)
-        if isinstance(force, openmm.CustomNonbondedForce):
-            custom_force = force
-            break
+    (custom_force,) = find_forces(system, openmm.CustomNonbondedForce)
 
+    assert custom_force.getUseSwitchingFunction() is True
     # make sure it has been adjusted
     assert custom_force.getSwitchingDistance() == 7.5 * unit.angstroms
 
+    buckingham_handler.switch_width = 0.0 * unit.angstroms
+    buckingham_handler.cutoff = default_cutoff
+
+    system = buckingham_water_force_field.create_openmm_system(water_box_topology)
+    (custom_force,) = find_forces(system, openmm.CustomNonbondedForce)
+
+    assert custom_force.getUseSwitchingFunction() is False
+
 
 def test_double_exp_energies(ideal_water_force_field):
     """
@@ -88,8 +73,7 @@ def test_double_exp_energies(ideal_water_force_field):
     )
     # calculated by hand (kJ / mol), at r_min the energy should be epsilon
     ref_values = [457.0334854, -0.635968, -0.4893932627]
-    for i, energy in enumerate(energies):
-        assert energy == pytest.approx(ref_values[i])
+    numpy.testing.assert_allclose(energies, ref_values, rtol=1e-6)
 
 
 def test_b68_energies(ideal_water_force_field):
@@ -131,8 +115,7 @@ def test_b68_energies(ideal_water_force_field):
     )
     # calculated by hand (kJ / mol)
     ref_values = [329.305, 1.303183, -0.686559]
-    for i, energy in enumerate(energies):
-        assert energy == pytest.approx(ref_values[i])
+    numpy.testing.assert_allclose(energies, ref_values, rtol=1e-6)
 
 
 def test_scaled_de_energy():
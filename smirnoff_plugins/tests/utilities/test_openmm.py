@@ -0,0 +1,24 @@
+from simtk import openmm
+
+from smirnoff_plugins.utilities.openmm import find_forces
+
+
+def test_find_forces():
+    """Make sure forces are found by type and returned in system order."""
+
+    system = openmm.System()
+
+    first_force = openmm.CustomNonbondedForce("0")
+    first_force.setName("first")
+    second_force = openmm.CustomNonbondedForce("0")
+    second_force.setName("second")
+
+    system.addForce(first_force)
+    system.addForce(openmm.HarmonicBondForce())
+    system.addForce(second_force)
+
+    found_forces = find_forces(system, openmm.CustomNonbondedForce)
+    assert [force.getName() for force in found_forces] == ["first", "second"]
+
+    assert len(find_forces(system, openmm.HarmonicBondForce)) == 1
+    assert find_forces(system, openmm.NonbondedForce) == []
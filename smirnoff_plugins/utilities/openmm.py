@@ -1,8 +1,10 @@
+import copy
+import functools
 import logging
 import math
 import os
 import time
-from typing import List, Literal, Optional, Tuple
+from typing import Dict, List, Literal, Optional, Tuple, Type, TypeVar
 
 import numpy
 from openff.toolkit.topology import Molecule, Topology, TopologyAtom
@@ -14,6 +16,59 @@ from smirnoff_plugins.utilities import temporary_cd
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T", bound=openmm.Force)
+
+# Systems with fewer particles than this are evaluated using a single CPU thread, as
+# the cost of spawning threads dominates the energy evaluation for such small systems.
+_SINGLE_THREAD_MAX_PARTICLES = 500
+
+
+def find_forces(system: openmm.System, force_type: Type[T]) -> List[T]:
+    """
+    Find all of the forces of a given type in an OpenMM system.
+
+    Parameters
+    ----------
+    system:
+        The openmm system to search.
+    force_type:
+        The type of force to find, e.g. ``openmm.CustomNonbondedForce``.
+
+    Returns
+    -------
+        The forces of the requested type in the order they appear in the system.
+    """
+
+    forces = [system.getForce(i) for i in range(system.getNumForces())]
+    return [force for force in forces if isinstance(force, force_type)]
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_water_molecule() -> Molecule:
+    """Build a water molecule with a single conformer. The returned object is shared
+    and so should never be modified, use ``_water_molecule`` instead."""
+
+    molecule = Molecule.from_smiles("O")
+    molecule.generate_conformers(n_conformers=1)
+
+    return molecule
+
+
+def _water_molecule() -> Molecule:
+    """Returns a copy of a water molecule with a single conformer, avoiding the cost
+    of re-parsing the SMILES and re-generating the conformer each time."""
+    return copy.deepcopy(_cached_water_molecule())
+
+
+def _cpu_platform_properties(system: openmm.System) -> Dict[str, str]:
+    """Returns the CPU platform properties which should be used when evaluating the
+    energy of a given system."""
+
+    if system.getNumParticles() < _SINGLE_THREAD_MAX_PARTICLES:
+        return {"Threads": "1"}
+
+    return {}
+
 
 def __simulate(
     positions: unit.Quantity,
@@ -204,8 +259,7 @@ def water_box(n_molecules: int) -> Tuple[Topology, unit.Quantity]:
     """
 
     # Create a topology containing water molecules.
-    molecule = Molecule.from_smiles("O")
-    molecule.generate_conformers(n_conformers=1)
+    molecule = _water_molecule()
 
     topology = Topology.from_molecules([molecule] * n_molecules)
 
@@ -236,7 +290,7 @@ def water_box(n_molecules: int) -> Tuple[Topology, unit.Quantity]:
 
 def evaluate_water_energy_at_distances(
     force_field: ForceField, distances: List[float]
-) -> List[float]:
+) -> numpy.ndarray:
     """
     Evaluate the energy of a system of two water molecules at the requested distances using the provided force field.
 
@@ -249,49 +303,17 @@ def evaluate_water_energy_at_distances(
 
     Returns
     -------
-        A list of energies evaluated at the given distances in kj/mol
+        An array of the energies evaluated at the given distances in kj/mol
     """
 
     # build the topology
-    water = Molecule.from_smiles("O")
-    water.generate_conformers(n_conformers=1)
+    water = _water_molecule()
     topology = Topology.from_molecules([water, water])
 
     # make the openmm system
     omm_system, topology = force_field.create_openmm_system(
         topology, return_topology=True
     )
-    # generate positions at the requested distance
-    positions = [
-        numpy.vstack(
-            [
-                water.conformers[0].value_in_unit(unit.angstrom),
-                water.conformers[0].value_in_unit(unit.angstrom)
-                + numpy.array([x, 0, 0]),
-            ]
-        )
-        * unit.angstrom
-        for x in distances
-    ]
-    # Add the virtual sites to the OpenMM topology and positions.
-    omm_topology = topology.to_openmm()
-    omm_chain = [*omm_topology.chains()][-1]
-    omm_residue = omm_topology.addResidue("", chain=omm_chain)
-
-    for particle in topology.topology_particles:
-
-        if isinstance(particle, TopologyAtom):
-            continue
-
-        omm_topology.addAtom(
-            particle.virtual_site.name, app.Element.getByMass(0), omm_residue
-        )
-
-    positions = [
-        numpy.vstack([p, numpy.zeros((topology.n_topology_virtual_sites, 3))])
-        * unit.angstrom
-        for p in positions
-    ]
 
     integrator = openmm.LangevinIntegrator(
         300 * unit.kelvin,  # simulation temperature,
@@ -301,17 +323,33 @@ def evaluate_water_energy_at_distances(
 
     platform = openmm.Platform.getPlatformByName("CPU")
 
-    simulation = app.Simulation(omm_topology, omm_system, integrator, platform)
+    # The energies only require a context, so skip building an OpenMM topology (and
+    # simulation) and re-use a single context for every distance.
+    context = openmm.Context(
+        omm_system, integrator, platform, _cpu_platform_properties(omm_system)
+    )
 
-    energies = []
-    for i, p in enumerate(positions):
-        simulation.context.setPositions(p)
-        simulation.context.computeVirtualSites()
-        state = simulation.context.getState(getEnergy=True)
-        energies.append(
-            state.getPotentialEnergy().value_in_unit(unit.kilojoule_per_mole)
+    conformer = water.conformers[0].value_in_unit(unit.angstrom)
+    # The virtual site positions are computed by the context.
+    virtual_site_positions = numpy.zeros((topology.n_topology_virtual_sites, 3))
+
+    energies = numpy.zeros(len(distances))
+
+    for i, distance in enumerate(distances):
+        # generate positions at the requested distance
+        positions = numpy.vstack(
+            [
+                conformer,
+                conformer + numpy.array([distance, 0, 0]),
+                virtual_site_positions,
+            ]
         )
 
+        context.setPositions(positions * unit.angstrom)
+        context.computeVirtualSites()
+        state = context.getState(getEnergy=True)
+        energies[i] = state.getPotentialEnergy().value_in_unit(unit.kilojoule_per_mole)
+
     return energies
 
 
@@ -344,7 +382,9 @@ def evaluate_energy(
 
     platform = openmm.Platform.getPlatformByName("CPU")
 
-    simulation = app.Simulation(topology, system, integrator, platform)
+    simulation = app.Simulation(
+        topology, system, integrator, platform, _cpu_platform_properties(system)
+    )
     # assume the positions are already padded.
     simulation.context.setPositions(positions)
     simulation.context.computeVirtualSites()